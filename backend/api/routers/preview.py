@@ -1,17 +1,24 @@
 # backend/api/routers/preview.py
 from fastapi import APIRouter, Response, HTTPException
 from pydantic import BaseModel, Field
-from typing import Literal
-from awsrt_core.io.manifests import load_environment
+from typing import Literal, Optional
+from awsrt_core.io.manifests import load_environment, load_fire
+from awsrt_core.io.priors import LRUCache, prior_key
 from awsrt_core.sim.belief import init_belief
+from awsrt_core.sim.priors import FIRE_PRIORS
 from awsrt_core.io.renders import belief_to_png
 
 router = APIRouter()
 
+# Rendered previews, keyed on the prior cache key (manifest contents and, for
+# terrain, the elevation file) plus the render parameters.
+_png_lru = LRUCache(maxsize=64)
+
 class BeliefPreviewPayload(BaseModel):
     env_id: str
-    prior: Literal["uniform"] = "uniform"
-    prior_strength: float = Field(1.0, ge=0.0)
+    fire_id: Optional[str] = None  # required for every prior except "uniform"
+    prior: Literal["uniform", "distance", "terrain", "ensemble"] = "uniform"
+    prior_strength: float = Field(1.0, ge=0.0, le=1.0)
     cmap: str = "viridis"
     vmin: float = 0.0
     vmax: float = 1.0
@@ -19,10 +26,29 @@ class BeliefPreviewPayload(BaseModel):
 
 @router.post("/belief.png")
 def preview_belief(p: BeliefPreviewPayload):
+    if p.prior in FIRE_PRIORS and p.fire_id is None:
+        raise HTTPException(status_code=400, detail=f"Prior '{p.prior}' requires fire_id")
     try:
         env = load_environment(p.env_id)
     except Exception:
         raise HTTPException(status_code=404, detail=f"Environment {p.env_id} not found")
-    arr = init_belief(env, p.prior, p.prior_strength)
-    png = belief_to_png(arr, cmap=p.cmap, vmin=p.vmin, vmax=p.vmax, quality=p.quality)
+    fire = None
+    if p.prior in FIRE_PRIORS:
+        try:
+            fire = load_fire(p.fire_id)
+        except Exception:
+            raise HTTPException(status_code=404, detail=f"Fire {p.fire_id} not found")
+        if fire.env_id != env.env_id:
+            raise HTTPException(status_code=400, detail=f"Fire {fire.fire_id} belongs to {fire.env_id}, not {env.env_id}")
+
+    key = "|".join(map(str, (prior_key(env, fire, p.prior), p.prior_strength,
+                             p.cmap, p.vmin, p.vmax, p.quality)))
+    png = _png_lru.get(key)
+    if png is None:
+        try:
+            arr = init_belief(env, p.prior, p.prior_strength, fire=fire)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        png = belief_to_png(arr, cmap=p.cmap, vmin=p.vmin, vmax=p.vmax, quality=p.quality)
+        _png_lru.put(key, png)
     return Response(content=png, media_type="image/png")
@@ -59,12 +59,17 @@ def init_run(req: InitRunRequest):
         fire = load_fire(req.fire_id)
     except Exception:
         raise HTTPException(404, f"Fire {req.fire_id} not found")
+    if fire.env_id != env.env_id:
+        raise HTTPException(400, f"Fire {fire.fire_id} belongs to {fire.env_id}, not {env.env_id}")
 
     H, W = env.grid.H, env.grid.W
 
     # Compute t=0 arrays
     s0 = state_from_ignitions(env, fire)      # uint8 {0,1}
-    b0 = init_belief_with_priors(env, fire)   # float32 [0,1]
+    try:
+        b0 = init_belief_with_priors(env, fire, req.prior, req.prior_strength)   # float32 [0,1]
+    except ValueError as e:
+        raise HTTPException(400, str(e))
 
     # Create Zarr, append t=0
     run_id = f"run-{uuid.uuid4().hex[:8]}"
@@ -82,6 +87,8 @@ def init_run(req: InitRunRequest):
         dt_seconds=req.dt_seconds,
         horizon_steps=req.horizon_steps,
         spread_prob=req.spread_prob,
+        prior=req.prior,
+        prior_strength=req.prior_strength,
     )
     _write_config(run_id, cfg)
 
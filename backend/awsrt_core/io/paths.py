@@ -6,9 +6,10 @@ MANIFESTS = DATA / "manifests"
 FIELDS = DATA / "fields"
 RENDERS = DATA / "renders"
 LOGS = DATA / "logs"
+PRIORS = MANIFESTS / "priors"
 
 def ensure_dirs():
-    for p in (DATA, MANIFESTS, FIELDS, RENDERS, LOGS):
+    for p in (DATA, MANIFESTS, FIELDS, RENDERS, LOGS, PRIORS):
         p.mkdir(parents=True, exist_ok=True)
 
 def run_fields_dir(run_id: str) -> Path:
@@ -16,3 +17,6 @@ def run_fields_dir(run_id: str) -> Path:
 
 def run_renders_dir(run_id: str, t: int) -> Path:
     return RENDERS / run_id / f"t{t:03d}"
+
+def prior_cache_path(key: str) -> Path:
+    return PRIORS / f"{key}.npy"
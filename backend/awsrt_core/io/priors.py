@@ -0,0 +1,86 @@
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+import numpy as np
+from .manifests import _hash_payload
+from .paths import prior_cache_path
+from awsrt_core.schemas.manifests import EnvironmentManifest, FireManifest
+from awsrt_core.sim.priors import raw_prior, elevation_path
+
+class LRUCache:
+    """Small thread-safe LRU; FastAPI runs sync endpoints in a threadpool."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._d: "OrderedDict[str, object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            v = self._d.get(key)
+            if v is not None:
+                self._d.move_to_end(key)
+            return v
+
+    def put(self, key: str, value):
+        with self._lock:
+            self._d[key] = value
+            self._d.move_to_end(key)
+            while len(self._d) > self.maxsize:
+                self._d.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._d.clear()
+
+# In-process LRU in front of the on-disk .npy cache (data/manifests/priors/)
+prior_lru = LRUCache(maxsize=32)
+
+def _elevation_fingerprint(env: EnvironmentManifest):
+    p = elevation_path(env)
+    if p is None or not p.exists():
+        return None
+    st = p.stat()
+    return [str(p), st.st_mtime_ns, st.st_size]
+
+def prior_key(env: EnvironmentManifest, fire: Optional[FireManifest], prior: str) -> str:
+    """Stable key over the manifest contents (and elevation file for terrain), not just their ids."""
+    payload = dict(env=env.model_dump(), fire=fire.model_dump() if fire is not None else None, prior=prior)
+    if prior == "terrain":
+        payload["elevation"] = _elevation_fingerprint(env)
+    return f"{env.env_id}-{prior}-{_hash_payload(payload)}"
+
+def _save_atomic(path, arr: np.ndarray):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.stem, suffix=".tmp", delete=False) as f:
+        np.save(f, arr)
+    os.replace(f.name, path)
+
+def get_prior(env: EnvironmentManifest, fire: Optional[FireManifest], prior: str = "uniform") -> np.ndarray:
+    """
+    Read-only float32 HxW raw prior (see sim.priors.raw_prior): LRU, then disk,
+    then compute and persist. "uniform" is a constant fill and is never cached.
+    """
+    if prior == "uniform":
+        return raw_prior(env, fire, prior)
+    key = prior_key(env, fire, prior)
+    arr = prior_lru.get(key)
+    if arr is not None:
+        return arr
+    path = prior_cache_path(key)
+    if path.exists():
+        try:
+            arr = np.load(path)
+        except Exception:
+            arr = None  # corrupt/partial file: recompute below
+    if arr is None or arr.shape != (env.grid.H, env.grid.W):
+        arr = raw_prior(env, fire, prior)
+        try:
+            _save_atomic(path, arr)
+        except OSError:
+            pass  # disk cache is best effort; the in-memory result is still valid
+    arr.setflags(write=False)  # shared between callers
+    prior_lru.put(key, arr)
+    return arr
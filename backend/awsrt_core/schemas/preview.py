@@ -3,8 +3,9 @@ from typing import Optional, Literal
 
 class BeliefPreviewRequest(BaseModel):
     env_id: str
-    prior: Literal["uniform"] = "uniform"
-    prior_strength: float = Field(1.0, ge=0.0)
+    fire_id: Optional[str] = None  # required for every prior except "uniform"
+    prior: Literal["uniform", "distance", "terrain", "ensemble"] = "uniform"
+    prior_strength: float = Field(1.0, ge=0.0, le=1.0)
 
 class FieldImageParams(BaseModel):
     cmap: str = "viridis"
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Literal
 
 class InitRunRequest(BaseModel):
     env_id: str
@@ -10,6 +10,9 @@ class InitRunRequest(BaseModel):
     horizon_steps: int = Field(24, ge=1)        # 24 frames
     # simple spread parameter for toy model
     spread_prob: float = Field(0.3, ge=0.0, le=1.0)
+    # initial belief
+    prior: Literal["uniform", "distance", "terrain", "ensemble"] = "distance"
+    prior_strength: float = Field(1.0, ge=0.0, le=1.0)
 
 class InitRunResponse(BaseModel):
     run_id: str
@@ -1,13 +1,14 @@
 import numpy as np
+from typing import Optional
 from awsrt_core.schemas.manifests import EnvironmentManifest, FireManifest
+from awsrt_core.io.priors import get_prior
+from awsrt_core.sim.priors import blend_prior
 
-def init_belief(env: EnvironmentManifest, prior: str = "uniform", strength: float = 1.0) -> np.ndarray:
-    H, W = env.grid.H, env.grid.W
-    if prior == "uniform":
-        return np.full((H, W), 0.5, dtype=np.float32)
-    # extend with other priors later
-    return np.full((H, W), 0.5, dtype=np.float32)
+def init_belief(env: EnvironmentManifest, prior: str = "uniform", strength: float = 1.0,
+                fire: Optional[FireManifest] = None) -> np.ndarray:
+    # Raw prior is cached per (manifests, prior); the strength blend is cheap and done per call
+    return blend_prior(get_prior(env, fire, prior), strength)
 
-def init_belief_with_priors(env: EnvironmentManifest, fire: FireManifest) -> np.ndarray:
-    # Minimal version: same as uniform for now; later we can nudge ignition cells
-    return init_belief(env, "uniform", 1.0)
+def init_belief_with_priors(env: EnvironmentManifest, fire: FireManifest,
+                            prior: str = "distance", strength: float = 1.0) -> np.ndarray:
+    return init_belief(env, prior, strength, fire=fire)
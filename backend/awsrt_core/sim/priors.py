@@ -0,0 +1,102 @@
+import numpy as np
+from pathlib import Path
+from typing import Optional
+from awsrt_core.schemas.manifests import EnvironmentManifest, FireManifest
+from awsrt_core.sim.fire_model import state_from_ignitions
+from awsrt_core.sim.wildfire_env import step
+
+PRIORS = ("uniform", "distance", "terrain", "ensemble")
+FIRE_PRIORS = ("distance", "terrain", "ensemble")
+
+# distance prior: e-folding length in cells
+DISTANCE_SCALE_CELLS = 8.0
+# terrain prior: how strongly mean grade toward the nearest ignition tilts the distance prior
+TERRAIN_SLOPE_GAIN = 3.0
+# ensemble prior: short Monte Carlo forecast with the toy spread model
+ENSEMBLE_MEMBERS = 32
+ENSEMBLE_STEPS = 8
+ENSEMBLE_SPREAD_PROB = 0.3
+
+def _ignition_cells(env: EnvironmentManifest, fire: FireManifest) -> np.ndarray:
+    H, W = env.grid.H, env.grid.W
+    cells = [(loc.row, loc.col) for loc in fire.ignitions.locations
+             if 0 <= loc.row < H and 0 <= loc.col < W]
+    if not cells:
+        raise ValueError(f"Fire {fire.fire_id} has no ignition inside the {H}x{W} grid of {env.env_id}")
+    return np.asarray(cells, dtype=np.float32)
+
+def _nearest_ignition(env: EnvironmentManifest, fire: FireManifest):
+    """Distance (cells) to the nearest in-grid ignition and that ignition's index, per cell."""
+    H, W = env.grid.H, env.grid.W
+    ign = _ignition_cells(env, fire)
+    rr, cc = np.mgrid[0:H, 0:W].astype(np.float32)
+    # (K, H, W); K is the number of ignitions, which is small
+    d = np.hypot(rr[None] - ign[:, 0, None, None], cc[None] - ign[:, 1, None, None])
+    idx = d.argmin(axis=0)
+    return np.take_along_axis(d, idx[None], axis=0)[0], idx, ign
+
+def elevation_path(env: EnvironmentManifest) -> Optional[Path]:
+    return Path(env.terrain_elev_path) if env.terrain_elev_path else None
+
+def load_elevation(env: EnvironmentManifest) -> np.ndarray:
+    """Elevation grid from env.terrain_elev_path (.npy, HxW); ValueError if absent or unusable."""
+    p = elevation_path(env)
+    if p is None:
+        raise ValueError(f"Environment {env.env_id} has no terrain_elev_path")
+    if p.suffix != ".npy" or not p.exists():
+        raise ValueError(f"Elevation grid {p} is missing or not a .npy file")
+    z = np.load(p)
+    if z.shape != (env.grid.H, env.grid.W):
+        raise ValueError(f"Elevation grid {p} has shape {z.shape}, expected {(env.grid.H, env.grid.W)}")
+    return z.astype(np.float32)
+
+def distance_prior(env: EnvironmentManifest, fire: FireManifest) -> np.ndarray:
+    d, _, _ = _nearest_ignition(env, fire)
+    return np.exp(-d / DISTANCE_SCALE_CELLS).astype(np.float32)
+
+def terrain_prior(env: EnvironmentManifest, fire: FireManifest) -> np.ndarray:
+    """Distance prior tilted upslope: fire runs faster uphill from its ignition."""
+    z = load_elevation(env)
+    d, idx, ign = _nearest_ignition(env, fire)
+    ign_i = ign.astype(np.intp)
+    z_ign = z[ign_i[:, 0], ign_i[:, 1]][idx]
+    run = np.maximum(d, 1.0) * env.grid.cell_size
+    grade = np.clip((z - z_ign) / run, -1.0, 1.0)
+    p = np.exp(-d / DISTANCE_SCALE_CELLS) * np.exp(TERRAIN_SLOPE_GAIN * grade)
+    return np.clip(p, 0.0, 1.0).astype(np.float32)
+
+def ensemble_prior(env: EnvironmentManifest, fire: FireManifest,
+                   members: int = ENSEMBLE_MEMBERS, steps: int = ENSEMBLE_STEPS,
+                   q: float = ENSEMBLE_SPREAD_PROB) -> np.ndarray:
+    """Burn probability after `steps` from `members` seeded runs of the spread model."""
+    _ignition_cells(env, fire)
+    s0 = state_from_ignitions(env, fire)
+    rng = np.random.default_rng(fire.seed)
+    burned = np.zeros(s0.shape, dtype=np.float32)
+    for _ in range(members):
+        s = s0
+        for _ in range(steps):
+            s = step(s, q=q, rng=rng)
+        burned += s
+    return burned / float(members)
+
+def raw_prior(env: EnvironmentManifest, fire: Optional[FireManifest], prior: str) -> np.ndarray:
+    """The named prior as burn probabilities in [0, 1], before blending with uniform."""
+    H, W = env.grid.H, env.grid.W
+    if prior not in PRIORS:
+        raise ValueError(f"Unknown prior {prior!r}; expected one of {PRIORS}")
+    if prior == "uniform":
+        return np.full((H, W), 0.5, dtype=np.float32)
+    if fire is None:
+        raise ValueError(f"Prior {prior!r} requires a fire manifest")
+    if prior == "distance":
+        return distance_prior(env, fire)
+    if prior == "terrain":
+        return terrain_prior(env, fire)
+    return ensemble_prior(env, fire)
+
+def blend_prior(p: np.ndarray, strength: float) -> np.ndarray:
+    """Belief at t=0: (1 - strength) * 0.5 + strength * p, for strength in [0, 1]."""
+    if not 0.0 <= strength <= 1.0:
+        raise ValueError(f"prior strength must be in [0, 1], got {strength}")
+    return ((1.0 - strength) * 0.5 + strength * p).astype(np.float32)
@@ -0,0 +1,117 @@
+import os
+import numpy as np
+import pytest
+
+import awsrt_core.io.paths as paths
+import awsrt_core.io.priors as io_priors
+from awsrt_core.schemas.manifests import EnvironmentManifest, FireManifest, GridSpec, IgnitionSpec, IgnitionCell
+from awsrt_core.sim.belief import init_belief
+from awsrt_core.sim.priors import raw_prior, ensemble_prior
+
+H, W = 30, 40
+IGN = (15, 20)
+
+@pytest.fixture(autouse=True)
+def prior_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "PRIORS", tmp_path / "priors")
+    io_priors.prior_lru.clear()
+    yield tmp_path / "priors"
+    io_priors.prior_lru.clear()
+
+@pytest.fixture
+def env(tmp_path):
+    # elevation rising west -> east
+    elev = tmp_path / "elev.npy"
+    np.save(elev, np.tile(np.arange(W, dtype=np.float32) * 10.0, (H, 1)))
+    return EnvironmentManifest(env_id="env-test", grid=GridSpec(H=H, W=W, cell_size=100.0),
+                               terrain_elev_path=str(elev))
+
+@pytest.fixture
+def fire():
+    return FireManifest(fire_id="fire-test", env_id="env-test", seed=7,
+                        ignitions=IgnitionSpec(locations=[IgnitionCell(row=IGN[0], col=IGN[1])]))
+
+@pytest.mark.parametrize("prior", ["uniform", "distance", "terrain", "ensemble"])
+def test_prior_shape_dtype_range(env, fire, prior):
+    b = init_belief(env, prior, 1.0, fire=fire)
+    assert b.shape == (H, W)
+    assert b.dtype == np.float32
+    assert b.min() >= 0.0 and b.max() <= 1.0
+
+@pytest.mark.parametrize("prior", ["distance", "terrain", "ensemble"])
+def test_ignition_cell_is_maximum(env, fire, prior):
+    p = raw_prior(env, fire, prior)
+    assert p[IGN] == p.max()
+
+def test_terrain_favours_upslope(env, fire):
+    p = raw_prior(env, fire, "terrain")
+    r, c = IGN
+    assert p[r, c + 5] > p[r, c - 5]
+
+def test_terrain_without_elevation_raises(env, fire):
+    flat = env.model_copy(update={"terrain_elev_path": None})
+    with pytest.raises(ValueError):
+        raw_prior(flat, fire, "terrain")
+
+def test_no_ignition_in_grid_raises(env):
+    outside = FireManifest(fire_id="fire-out", env_id="env-test",
+                           ignitions=IgnitionSpec(locations=[IgnitionCell(row=H + 5, col=W + 5)]))
+    for prior in ("distance", "terrain", "ensemble"):
+        with pytest.raises(ValueError):
+            raw_prior(env, outside, prior)
+
+def test_ensemble_deterministic_for_seed(env, fire):
+    np.testing.assert_array_equal(ensemble_prior(env, fire), ensemble_prior(env, fire))
+
+def test_strength_blends_with_uniform(env, fire):
+    p = raw_prior(env, fire, "distance")
+    np.testing.assert_allclose(init_belief(env, "distance", 0.0, fire=fire), 0.5)
+    np.testing.assert_allclose(init_belief(env, "distance", 0.5, fire=fire), 0.25 + 0.5 * p, rtol=1e-6)
+    with pytest.raises(ValueError):
+        init_belief(env, "distance", 1.5, fire=fire)
+
+def _counting_raw_prior(monkeypatch):
+    calls = []
+    def counted(*args):
+        calls.append(args)
+        return raw_prior(*args)
+    monkeypatch.setattr(io_priors, "raw_prior", counted)
+    return calls
+
+def test_cache_hit_does_not_recompute(env, fire, monkeypatch, prior_cache):
+    calls = _counting_raw_prior(monkeypatch)
+    a = io_priors.get_prior(env, fire, "ensemble")
+    b = io_priors.get_prior(env, fire, "ensemble")
+    assert a is b
+    assert len(calls) == 1
+    assert not a.flags.writeable
+
+    # a cold LRU is served from disk
+    io_priors.prior_lru.clear()
+    c = io_priors.get_prior(env, fire, "ensemble")
+    np.testing.assert_array_equal(a, c)
+    assert len(calls) == 1
+    assert len(list(prior_cache.glob("*.npy"))) == 1
+
+def test_uniform_is_not_persisted(env, prior_cache):
+    io_priors.get_prior(env, None, "uniform")
+    assert not prior_cache.exists() or not any(prior_cache.iterdir())
+
+def test_corrupt_cache_file_is_recomputed(env, fire, monkeypatch):
+    expected = raw_prior(env, fire, "distance")
+    path = paths.prior_cache_path(io_priors.prior_key(env, fire, "distance"))
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a npy file")
+
+    calls = _counting_raw_prior(monkeypatch)
+    np.testing.assert_array_equal(io_priors.get_prior(env, fire, "distance"), expected)
+    assert len(calls) == 1
+    np.testing.assert_array_equal(np.load(path), expected)
+
+def test_terrain_key_tracks_elevation_file(env, fire):
+    k1 = io_priors.prior_key(env, fire, "terrain")
+    np.save(env.terrain_elev_path, np.zeros((H, W), dtype=np.float32))
+    # same size as before; force a distinct mtime on coarse-resolution filesystems
+    st = os.stat(env.terrain_elev_path)
+    os.utime(env.terrain_elev_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert io_priors.prior_key(env, fire, "terrain") != k1